@@ -19,13 +19,26 @@ import matplotlib.pyplot as plt # import for diagram / visualization
 import json # import for storing the data
 import os # import for storing the data
 import pandas as pd
+import base64 # import for storing compressed archives in the json file
+import lzma # import for compressing archived months
+import zlib # import for compressing archived months
+from collections import OrderedDict # import for the archive cache (LRU)
+
+
+# compression codecs for archived months: name -> (compress, decompress)
+ARCHIVE_CODECS = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress)
+}
 
 
 class HabitTrackerDaily:
     """Class to track daily habits with rewards and streaks."""
     
-    def __init__(self, file_name="habit_data.json"):
-        self.entries = {}
+    def __init__(self, file_name="habit_data.json", hot_days=56, archive_codec="zlib", archive_cache_size=3):
+        if archive_codec not in ARCHIVE_CODECS:
+            raise ValueError(f"Unknown archive codec '{archive_codec}'. Use one of: {', '.join(ARCHIVE_CODECS)}.")
+        self.entries = {}  # Recent entries (hot), kept uncompressed in memory
         self.previous_successes = []
         self.REWARD_MESSAGES = {
             7: "Congrats! You've tracked your habits for one week! Keep the momentum going! 🎉",
@@ -38,6 +51,11 @@ class HabitTrackerDaily:
             365: "One year of daily tracking! You're a self-care champion! 🎉🎊"
         }
         self.file_name = file_name  # File to store and load data
+        self.hot_days = hot_days  # Entries older than this (whole months) are moved into compressed archives
+        self.archive_codec = archive_codec  # Codec used for newly written archives
+        self.archive_cache_size = archive_cache_size  # Number of decompressed months kept in memory
+        self.archives = {}  # Archived months {'YYYY-MM': {'codec': ..., 'data': bytes, 'aggregates': {...}}}
+        self._archive_cache = OrderedDict()  # Decompressed months, least recently used first
 
     def add_entry(self, food, sport, sleep, fun, rest):
         """Add daily habit entry, only one per day allowed."""
@@ -83,34 +101,32 @@ class HabitTrackerDaily:
 
     def calculate_streak(self):
         """Calculate the current streak of consecutive days with entries."""
-        sorted_dates = sorted(self.entries.keys(), reverse=True)
         streak = 0
-        today = datetime.date.today()
-        for i, date_str in enumerate(sorted_dates):
-            expected_date = (today - datetime.timedelta(days=i)).isoformat()
-            if date_str == expected_date:
-                streak += 1
-            else:
-                break
+        day = datetime.date.today()
+        # Archived months are only opened once the streak reaches back into them
+        while self._get_entry(day.isoformat()) is not None:
+            streak += 1
+            day -= datetime.timedelta(days=1)
         return streak
 
     def calculate_selfcare(self, date):
         """Calculate the selfcare score for a given date."""
-        if date not in self.entries:
+        habits = self._get_entry(date)
+        if habits is None:
             return None
-        habit_values = self.entries[date].values()
+        habit_values = habits.values()
         return sum(habit_values) / len(habit_values)
 
     def calculate_weekly_selfcare(self):
         """Calculate average self-care value for each week."""
         weekly_selfcare = {}
-        for date, habits in self.entries.items():
+        for date, habits in self._entries_in_range().items():
             year, week, _ = datetime.date.fromisoformat(date).isocalendar()
             week_key = f"{year}-W{week}"
         
             if week_key not in weekly_selfcare:
                 weekly_selfcare[week_key] = []
-            weekly_selfcare[week_key].append(self.calculate_selfcare(date))
+            weekly_selfcare[week_key].append(sum(habits.values()) / len(habits))
     
         # calculate weekly averages
         weekly_averages = {week: sum(values) / len(values) for week, values in weekly_selfcare.items()}
@@ -149,8 +165,8 @@ class HabitTrackerDaily:
 
     def show_all_data(self):
         """Display all recorded data with selfcare scores."""
-        for date, habits in sorted(self.entries.items()):
-            selfcare = self.calculate_selfcare(date)
+        for date, habits in sorted(self._entries_in_range().items()):
+            selfcare = sum(habits.values()) / len(habits)
             print(f"{date} - Habits: {habits}, Selfcare: {selfcare:.2f}")
 
     def add_demo_data(self):
@@ -169,32 +185,41 @@ class HabitTrackerDaily:
     def calculate_statistics(self):
         """Calculate average, best, and worst values for each habit and selfcare."""
         try:
-            if not self.entries:
+            if not self.entries and not self.archives:
                 raise ValueError("No data available to calculate statistics.")
             
-            # Collect all values for each habit
-            all_values = {habit: [] for habit in ['food', 'sport', 'sleep', 'fun', 'rest']}
-            all_selfcare = []
+            # Aggregate the hot entries and reuse the stored aggregates of archived months,
+            # so no archive has to be decompressed
+            all_aggregates = [segment['aggregates'] for segment in self.archives.values()]
+            if self.entries:
+                all_aggregates.append(self._compute_aggregates(self.entries))
             
-            for date, habits in self.entries.items():
-                for habit, value in habits.items():
-                    all_values[habit].append(value)
-                all_selfcare.append(self.calculate_selfcare(date))
+            totals = {}
+            for aggregates in all_aggregates:
+                for key, aggregate in aggregates.items():
+                    if key not in totals:
+                        totals[key] = dict(aggregate)
+                    else:
+                        totals[key]['sum'] += aggregate['sum']
+                        totals[key]['count'] += aggregate['count']
+                        totals[key]['best'] = max(totals[key]['best'], aggregate['best'])
+                        totals[key]['worst'] = min(totals[key]['worst'], aggregate['worst'])
             
-            # Calculate statistics
+            # Calculate statistics (selfcare last)
+            selfcare = totals.pop('selfcare')
             statistics = {
-                habit: {
-                    'average': sum(values) / len(values),
-                    'best': max(values),
-                    'worst': min(values)
+                key: {
+                    'average': total['sum'] / total['count'],
+                    'best': total['best'],
+                    'worst': total['worst']
                 }
-                for habit, values in all_values.items()
+                for key, total in totals.items()
             }
             
             statistics['selfcare'] = {
-                'average': sum(all_selfcare) / len(all_selfcare),
-                'best': max(all_selfcare),
-                'worst': min(all_selfcare)
+                'average': selfcare['sum'] / selfcare['count'],
+                'best': selfcare['best'],
+                'worst': selfcare['worst']
             }
             
             return statistics
@@ -202,15 +227,16 @@ class HabitTrackerDaily:
             print(f"Error: {e}")
             return None
 
-    def plot_selfcare(self):
-        """Generate a line plot of the Selfcare values over time."""
+    def plot_selfcare(self, start_date=None, end_date=None):
+        """Generate a line plot of the Selfcare values over time (optionally between two ISO dates)."""
         try:
-            if not self.entries:
+            entries = self._entries_in_range(start_date, end_date)
+            if not entries:
                 raise ValueError("No data available to plot selfcare.")
             
             # Extract dates and selfcare values
-            dates = sorted(self.entries.keys())
-            selfcare_values = [self.calculate_selfcare(date) for date in dates]
+            dates = sorted(entries.keys())
+            selfcare_values = [sum(entries[date].values()) / len(entries[date]) for date in dates]
             
             # Plot the data
             plt.figure(figsize=(10, 6))
@@ -224,9 +250,90 @@ class HabitTrackerDaily:
             plt.show()
         except ValueError as e:
             print(f"Error: {e}")
+
+    def archive_old_entries(self):
+        """Move entries of months older than the hot window into compressed monthly archives."""
+        cutoff = (datetime.date.today() - datetime.timedelta(days=self.hot_days)).replace(day=1).isoformat()
+        old_months = {}
+        for date in [date for date in self.entries if date < cutoff]:
+            old_months.setdefault(date[:7], {})[date] = self.entries.pop(date)
+        
+        for month, month_entries in old_months.items():
+            # Merge with an already archived month, new values win
+            if month in self.archives:
+                month_entries = {**self._load_archive(month), **month_entries}
+            compress, _ = ARCHIVE_CODECS[self.archive_codec]
+            self.archives[month] = {
+                'codec': self.archive_codec,
+                'data': compress(json.dumps(month_entries).encode('utf-8')),
+                'aggregates': self._compute_aggregates(month_entries)
+            }
+            self._archive_cache.pop(month, None)
+
+    def _compute_aggregates(self, entries):
+        """Calculate sum, count, best and worst value for each habit and selfcare."""
+        aggregates = {}
+        for habits in entries.values():
+            values = list(habits.items()) + [('selfcare', sum(habits.values()) / len(habits))]
+            for key, value in values:
+                if key not in aggregates:
+                    aggregates[key] = {'sum': 0, 'count': 0, 'best': value, 'worst': value}
+                aggregate = aggregates[key]
+                aggregate['sum'] += value
+                aggregate['count'] += 1
+                aggregate['best'] = max(aggregate['best'], value)
+                aggregate['worst'] = min(aggregate['worst'], value)
+        # keep selfcare as the last key
+        if 'selfcare' in aggregates:
+            aggregates['selfcare'] = aggregates.pop('selfcare')
+        return aggregates
+
+    def _load_archive(self, month):
+        """Return the decompressed entries of an archived month (cached, least recently used is evicted)."""
+        if month in self._archive_cache:
+            self._archive_cache.move_to_end(month)
+            return self._archive_cache[month]
+        
+        segment = self.archives[month]
+        _, decompress = ARCHIVE_CODECS[segment['codec']]
+        month_entries = json.loads(decompress(segment['data']).decode('utf-8'))
+        self._archive_cache[month] = month_entries
+        while len(self._archive_cache) > self.archive_cache_size:
+            self._archive_cache.popitem(last=False)
+        return month_entries
+
+    def _get_entry(self, date):
+        """Return the habits for a date from the hot entries or its archived month, None if missing."""
+        if date in self.entries:
+            return self.entries[date]
+        if date[:7] in self.archives:
+            return self._load_archive(date[:7]).get(date)
+        return None
+
+    def _entries_in_range(self, start_date=None, end_date=None):
+        """Collect hot and archived entries between two ISO dates, only opening the archives needed."""
+        entries = {}
+        for month in sorted(self.archives):
+            if (start_date is None or month >= start_date[:7]) and (end_date is None or month <= end_date[:7]):
+                entries.update(self._load_archive(month))
+        entries.update(self.entries)
+        return {
+            date: habits for date, habits in entries.items()
+            if (start_date is None or date >= start_date) and (end_date is None or date <= end_date)
+        }
+
     def save_to_file(self):
+        self.archive_old_entries()
         data = {
             'entries': self.entries,
+            'archives': {
+                month: {
+                    'codec': segment['codec'],
+                    'data': base64.b64encode(segment['data']).decode('ascii'),
+                    'aggregates': segment['aggregates']
+                }
+                for month, segment in self.archives.items()
+            },
             'previous_successes': self.previous_successes
         }
         with open(self.file_name, 'w') as file:
@@ -237,6 +344,8 @@ class HabitTrackerDaily:
         if not os.path.exists(self.file_name) or os.stat(self.file_name).st_size == 0:
             print(f"Die Datei {self.file_name} existiert nicht oder ist leer. Standardwerte werden verwendet.")
             self.entries = {}
+            self.archives = {}
+            self._archive_cache.clear()
             self.previous_successes = []
             return
     
@@ -244,10 +353,24 @@ class HabitTrackerDaily:
             with open(self.file_name, 'r') as file:
                 data = json.load(file)  # Versuche, die Datei zu laden
             self.entries = data.get('entries', {})
+            # Archived months stay compressed until a query needs them
+            self.archives = {
+                month: {
+                    'codec': segment['codec'],
+                    'data': base64.b64decode(segment['data']),
+                    'aggregates': segment['aggregates']
+                }
+                for month, segment in data.get('archives', {}).items()
+            }
+            self._archive_cache.clear()
             self.previous_successes = data.get('previous_successes', [])
+            # Older files keep all entries hot, move old months into archives
+            self.archive_old_entries()
         except (json.JSONDecodeError, IOError) as e:
             print(f"Fehler beim Laden der Datei: {e}")
             self.entries = {}
+            self.archives = {}
+            self._archive_cache.clear()
             self.previous_successes = []
             
     # Example test function for duplicate entry
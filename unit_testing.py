@@ -107,6 +107,40 @@ class TestHabitTrackerDaily(unittest.TestCase):
         # Ensure that the reward message is present
         self.assertGreater(len(self.tracker.previous_successes), 0)
 
+    def test_archive_old_entries(self):
+        """Test that old months are archived and still used for streaks and statistics."""
+        today = datetime.date.today()
+        for i in range(200):
+            self.tracker.entries[(today - datetime.timedelta(days=i)).isoformat()] = {
+                'food': 8, 'sport': 7, 'sleep': 6, 'fun': 5, 'rest': 9
+            }
+        stats_before = self.tracker.calculate_statistics()
+        
+        self.tracker.archive_old_entries()
+        self.assertGreater(len(self.tracker.archives), 0)
+        self.assertLess(len(self.tracker.entries), 200)
+        
+        # Statistics come from the stored aggregates without decompressing
+        self.assertEqual(self.tracker.calculate_statistics(), stats_before)
+        self.assertEqual(len(self.tracker._archive_cache), 0)
+        
+        # The streak reaches back into the archived months
+        self.assertEqual(self.tracker.calculate_streak(), 200)
+        self.assertLessEqual(len(self.tracker._archive_cache), self.tracker.archive_cache_size)
+
+    def test_load_archived_entries(self):
+        """Test saving and loading archived months."""
+        old_date = (datetime.date.today() - datetime.timedelta(days=365)).isoformat()
+        self.tracker.entries[old_date] = {'food': 8, 'sport': 7, 'sleep': 6, 'fun': 5, 'rest': 9}
+        self.tracker.save_to_file()
+
+        # Create a new instance and load data
+        new_tracker = HabitTrackerDaily()
+        new_tracker.load_from_file()
+        self.assertNotIn(old_date, new_tracker.entries)
+        self.assertIn(old_date[:7], new_tracker.archives)
+        self.assertAlmostEqual(new_tracker.calculate_selfcare(old_date), 7.0)
+
 
 # In[71]:
 